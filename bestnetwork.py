@@ -13,24 +13,24 @@ tf.compat.v1.enable_eager_execution()
 
 # Load and prepare the data
 def prepare_data():
-    # Step 1: Load the dataset
-    data = pd.read_csv('dataset/dataset.csv')
-    
-    # Step 2: Define features and target (using same features as Neural Network.py)
+    # Step 1: Define features and target (using same features as Neural Network.py)
     features = ['lambda', 'Lq', 's', 'mu', 'rho']
-    X = data[features]
-    y = data['Wq']
     
-    # Step 3: Remove invalid data (same as Neural Network.py)
-    valid_rows = ~(X.isna().any(axis=1) | y.isna())
-    X = X[valid_rows]
-    y = y[valid_rows]
+    # Step 2: Load only the needed columns of the dataset
+    data = pd.read_csv('dataset/dataset.csv', usecols=features + ['Wq'], dtype=np.float32)
+    
+    # Step 3: Extract features and target as one float32 matrix (Keras trains in float32)
+    values = data[features + ['Wq']].to_numpy(dtype=np.float32)
+    
+    # Step 4: Remove invalid data (NaN and +/-inf) with one isfinite sweep
+    values = values[np.isfinite(values).all(axis=1)]
+    X, y = values[:, :-1], values[:, -1]
 
     # Split the data
     X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 
-    # Scale the features
-    scaler = StandardScaler()
+    # Scale the features in place (the split arrays are already fresh copies)
+    scaler = StandardScaler(copy=False)
     X_train_scaled = scaler.fit_transform(X_train)
     X_test_scaled = scaler.transform(X_test)
 
@@ -92,8 +92,10 @@ def test_configurations():
                      metrics=['mse', 'mae'])  # Track both MSE and MAE
         
         # Early stopping to prevent unnecessary training
+        # min_delta ignores negligible val_loss gains so training stops sooner
         early_stopping = keras.callbacks.EarlyStopping(
             monitor='val_loss',
+            min_delta=1e-4,
             patience=5,
             restore_best_weights=True
         )